@@ -18,156 +18,379 @@ structured Excel files (.xlsx).
 --------------------------------------------------------------------------------
 ### How to Run:
 1. Make sure you have the required libraries installed:
-   `pip install vobject openpyxl phonenumbers chardet`
+   `pip install openpyxl lxml phonenumbers chardet`
+   (optional, for faster encoding detection: `pip install cchardet`)
 2. Run the script:
    `python vcf_converter_gui.py`
 ================================================================================
 """
 
+import codecs
+import collections
+import functools
+import itertools
+import multiprocessing
 import os
+import queue
+import quopri
+import re
 import sys
+import threading
 import tkinter as tk
-from tkinter import filedialog, messagebox, font
-from typing import List, Set, Tuple, Optional
+from concurrent.futures import Executor, ProcessPoolExecutor
+from tkinter import filedialog, messagebox, font, ttk
+from typing import BinaryIO, Callable, Iterable, Iterator, List, Set, Tuple, Optional
 
 # --- Backend Libraries ---
-import chardet
+try:
+    import cchardet as _chardet  # C implementation (libuchardet), much faster
+except ImportError:
+    import chardet as _chardet
 import openpyxl
 import phonenumbers
-import vobject
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font as OpenPyxlFont
-from openpyxl.utils import get_column_letter
 
-
-# --- Backend Logic (Core conversion functions) ---
-
-def read_vcf_content(file_path: str) -> str:
+# Encoding detection only needs a sample: vCard text is homogeneous, so
+# scanning the whole file is wasted work on large address books.
+ENCODING_SAMPLE_SIZE = 64 * 1024
+# Most exports (Android/iOS) are BOM-prefixed UTF-8 or plain ASCII; a cheap
+# look at the first bytes lets us skip the detector entirely for them.
+UTF8_BOM = b'\xef\xbb\xbf'
+ASCII_PREFIX_SIZE = 4 * 1024
+# Encodings tried when decoding values. cp1256 accepts every byte, so only
+# what comes before it is ever tried; a detected encoding is put there only
+# when the detector is confident, otherwise Arabic (cp1256) keeps priority.
+ENCODING_MIN_CONFIDENCE = 0.5
+_PRIMARY_ENCODINGS = ('utf-8', 'cp1256')
+_FALLBACK_ENCODINGS = ('utf-8-sig', 'latin-1', 'iso-8859-6', 'cp1252')
+_DEFAULT_ENCODINGS = _PRIMARY_ENCODINGS + _FALLBACK_ENCODINGS
+_CANONICAL_NAMES = {e: codecs.lookup(e).name for e in _DEFAULT_ENCODINGS}
+# The file is streamed in buffers of this size so memory stays O(single card).
+READ_BUFFER_SIZE = 1024 * 1024
+# Cards are parsed in worker processes, this many per task. Starting the pool
+# (one fresh interpreter per core) only pays off on multi-core machines with
+# at least this many batches per worker; otherwise cards are parsed in-process.
+CARD_BATCH_SIZE = 1000
+POOL_MIN_BATCHES_PER_WORKER = 4
+# Column widths are fitted to the first rows: write-only sheets must declare
+# them before any row is written, so only this many rows are held back.
+WIDTH_SAMPLE_ROWS = 1000
+# Address books repeat the same numbers and prefixes, so normalization
+# results are memoized per (cleaned_number, region).
+NORMALIZE_CACHE_SIZE = 100_000
+_E164 = phonenumbers.PhoneNumberFormat.E164
+# The GUI polls the worker thread's queue at this interval (ms) and gets a
+# progress message every PROGRESS_INTERVAL rows.
+QUEUE_POLL_MS = 50
+PROGRESS_INTERVAL = 1000
+
+
+class _PhoneCharFilter(dict):
     """
-    Reads VCF file content with maximum robustness by reading as binary first
-    and ignoring any decoding errors. This is the final fallback for corrupted files.
+    `str.translate` table that deletes everything except digits and '+'.
+    Latin-1 is precomputed; other characters (Arabic-Indic digits,
+    direction marks, ...) are classified on first sight and cached.
     """
-    try:
-        with open(file_path, 'rb') as f:
-            raw_data = f.read()
-    except (IOError, FileNotFoundError) as e:
-        raise ValueError(f"Could not read the file from disk: {e}")
 
-    # --- Automatic detection logic ---
-    encodings_to_try = ['utf-8', 'cp1256']
-    
-    try:
-        detected = chardet.detect(raw_data)['encoding']
-        if detected and detected.lower() not in encodings_to_try:
-            encodings_to_try.append(detected.lower())
-    except Exception:
-        pass
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        char = chr(codepoint)
+        result = codepoint if char.isdigit() or char == '+' else None
+        self[codepoint] = result
+        return result
+
+
+_PHONE_KEEP = _PhoneCharFilter(
+    str.maketrans('', '', ''.join(chr(c) for c in range(256) if not (chr(c).isdigit() or chr(c) == '+')))
+)
+
+# --- vCard patterns (matched on raw bytes, only extracted values get decoded) ---
+# Card boundaries are case-insensitive like property names; the greedy
+# prefix makes _CARD_BEGIN_RE find the last BEGIN:VCARD in a range.
+_CARD_BEGIN_RE = re.compile(rb'.*(BEGIN:VCARD)', re.S | re.I)
+_CARD_END_RE = re.compile(rb'END:VCARD', re.I)
+_CARD_END_LEN = len(b'END:VCARD')
+_CARD_RE = re.compile(rb'BEGIN:VCARD\r?\n(.*?)END:VCARD', re.S | re.I)
+_FOLDED_LINE_RE = re.compile(rb'\r?\n[ \t]')
+# Optional group prefix ("item1."), parameters, then the value. Lines ending
+# in "=" are kept together so quoted-printable soft line breaks survive.
+_PROPERTY = rb'^(?:[\w-]+\.)?%s((?:;[^:\r\n]*)?):((?:[^\r\n]*=\r?\n)*[^\r\n]*)'
+_FN_RE = re.compile(_PROPERTY % rb'FN', re.M | re.I)
+_N_RE = re.compile(_PROPERTY % rb'N', re.M | re.I)
+_ORG_RE = re.compile(_PROPERTY % rb'ORG', re.M | re.I)
+_TEL_RE = re.compile(_PROPERTY % rb'TEL', re.M | re.I)
+_COMPONENT_SEP_RE = re.compile(r'(?<!\\);')
+_ESCAPE_RE = re.compile(r'\\(.)')
 
-    encodings_to_try.extend(['utf-8-sig', 'latin-1', 'iso-8859-6', 'cp1252'])
 
+# --- Backend Logic (Core conversion functions) ---
+
+def detect_encodings(raw_data: bytes) -> List[str]:
+    """Returns the encodings to try when decoding values, most likely first."""
+    detected = None
+    confidence = 0.0
+
+    # --- Fast path for the common cases (BOM-prefixed or ASCII files) ---
+    if raw_data[:3] != UTF8_BOM and not raw_data[:ASCII_PREFIX_SIZE].isascii():
+        # --- Automatic detection logic ---
+        try:
+            result = _chardet.detect(raw_data[:ENCODING_SAMPLE_SIZE])
+            detected, confidence = result['encoding'], result['confidence'] or 0.0
+            # Canonical codec name, so aliases like "windows-1256" match.
+            detected = codecs.lookup(detected).name if detected else None
+        except Exception:
+            detected = None
+
+    if not detected or detected in (_CANONICAL_NAMES[e] for e in _PRIMARY_ENCODINGS):
+        return list(_DEFAULT_ENCODINGS)
+    fallbacks = [e for e in _FALLBACK_ENCODINGS if _CANONICAL_NAMES[e] != detected]
+    if confidence >= ENCODING_MIN_CONFIDENCE:
+        return ['utf-8', detected, 'cp1256', *fallbacks]
+    return [*_PRIMARY_ENCODINGS, detected, *fallbacks]
+
+def decode_text(raw_data: bytes, encodings_to_try: List[str]) -> str:
+    """
+    Decodes a value with the first encoding that fits it strictly. Only if
+    none does are undecodable bytes replaced, the final fallback for
+    corrupted files.
+    """
     for encoding in encodings_to_try:
         try:
-            return raw_data.decode(encoding, errors='ignore')
-        except (UnicodeError, TypeError):
+            return raw_data.decode(encoding)
+        except (UnicodeError, TypeError, LookupError):
             continue
             
     return raw_data.decode('utf-8', errors='replace')
 
+def _unescape(value: str) -> str:
+    """Undoes vCard text escaping (backslash-escaped commas, semicolons, newlines)."""
+    return _ESCAPE_RE.sub(lambda m: ' ' if m.group(1) in 'nN' else m.group(1), value)
+
+def _property_value(params: bytes, value: bytes) -> bytes:
+    """Resolves quoted-printable values; other values end at the line break."""
+    if b'QUOTED-PRINTABLE' in params.upper():
+        return quopri.decodestring(value)
+    return value.split(b'\n', 1)[0].rstrip(b'\r')
+
+def _read_property(pattern: re.Pattern, card: bytes, encodings: List[str]) -> Optional[str]:
+    """Returns the decoded (still escaped) value of the first matching property."""
+    match = pattern.search(card)
+    if match is None:
+        return None
+    return decode_text(_property_value(*match.groups()), encodings)
+
+@functools.lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize(cleaned_number: str, region: str) -> str:
+    """Formats a cleaned number as E.164, or returns "" if it is not valid."""
+    try:
+        parsed_number = phonenumbers.parse(cleaned_number, region)
+        if phonenumbers.is_valid_number(parsed_number):
+            return phonenumbers.format_number(parsed_number, _E164)
+    except phonenumbers.NumberParseException:
+        pass
+    return ""
 
 def normalize_phone_number(number_str: str, region: str) -> str:
     """Normalizes a phone number to E.164 format."""
     if not number_str:
         return ""
-    try:
-        cleaned_number = "".join(filter(lambda char: char.isdigit() or char in '+', number_str))
-        parsed_number = phonenumbers.parse(cleaned_number, region)
-        if phonenumbers.is_valid_number(parsed_number):
-            return phonenumbers.format_number(parsed_number, phonenumbers.PhoneNumberFormat.E164)
-    except phonenumbers.phonenumbersutil.NumberParseException:
-        pass
-    return number_str.strip()
+    cleaned_number = number_str.translate(_PHONE_KEEP)
+    return _normalize(cleaned_number, region) or number_str.strip()
 
-def get_contact_name(vcard: vobject.vCard) -> str:
+def get_contact_name(card: bytes, encodings: List[str]) -> str:
     """Extracts the contact name using a fallback strategy: FN -> N -> ORG."""
-    if hasattr(vcard, 'fn'):
-        if vcard.fn.value and vcard.fn.value.strip():
-            return vcard.fn.value.strip()
-    if hasattr(vcard, 'n'):
-        n = vcard.n.value
-        name_parts = [part.strip() for part in [n.given, n.middle, n.family] if part and part.strip()]
+    fn = _read_property(_FN_RE, card, encodings)
+    if fn:
+        fn = _unescape(fn).strip()
+        if fn:
+            return fn
+    n = _read_property(_N_RE, card, encodings)
+    if n:
+        family, given, middle = (_COMPONENT_SEP_RE.split(n) + ['', ''])[:3]
+        name_parts = [_unescape(part).strip() for part in (given, middle, family) if part]
+        name_parts = [part for part in name_parts if part]
         if name_parts:
             return " ".join(name_parts)
-    if hasattr(vcard, 'org'):
-        if vcard.org.value and vcard.org.value[0] and vcard.org.value[0].strip():
-            return vcard.org.value[0].strip()
+    org = _read_property(_ORG_RE, card, encodings)
+    if org:
+        org = _unescape(_COMPONENT_SEP_RE.split(org, 1)[0]).strip()
+        if org:
+            return org
     return "غير معروف"
 
-def process_vcf_data(vcf_content: str, default_region: str) -> List[Tuple[str, str]]:
-    """Parses VCF content and extracts a list of (name, phone_number) tuples."""
-    processed_contacts = []
+def _iter_card_blocks(f: BinaryIO, buffer: bytes) -> Iterator[bytes]:
+    """
+    Yields each BEGIN:VCARD...END:VCARD block of the stream, reading it in
+    READ_BUFFER_SIZE chunks and carrying incomplete cards across reads.
+    `buffer` holds the bytes already read from `f`.
+    """
+    start = search_from = 0
+    while True:
+        end_match = _CARD_END_RE.search(buffer, search_from)
+        if end_match is None:
+            chunk = f.read(READ_BUFFER_SIZE)
+            if not chunk:
+                return
+            buffer = buffer[start:] + chunk
+            search_from = max(0, len(buffer) - len(chunk) - _CARD_END_LEN + 1)
+            start = 0
+            continue
+        end = end_match.end()
+        # A card without END:VCARD is dropped, only the last BEGIN counts.
+        begin_match = _CARD_BEGIN_RE.match(buffer, start, end)
+        if begin_match is not None:
+            yield buffer[begin_match.start(1):end]
+        start = search_from = end
+
+def _parse_card(block: bytes, encodings: List[str], default_region: str) -> List[Tuple[str, str]]:
+    """Extracts the (name, phone_number) tuples of a single card block."""
+    match = _CARD_RE.match(block)
+    if match is None:
+        return []
+    card = _FOLDED_LINE_RE.sub(b'', match.group(1))
+    name = get_contact_name(card, encodings)
+    normalized_numbers: Set[str] = set()
+    for params, value in _TEL_RE.findall(card):
+        tel = decode_text(_property_value(params, value), encodings)
+        if tel and tel.strip():
+            normalized = normalize_phone_number(tel, default_region)
+            if normalized:
+                normalized_numbers.add(normalized)
+
+    return [(name, number) for number in sorted(normalized_numbers)]
+
+def _parse_batch(blocks: List[bytes], encodings: List[str], default_region: str) -> List[Tuple[str, str]]:
+    """Parses a batch of card blocks; runs in a worker process."""
+    contacts = []
+    for block in blocks:
+        try:
+            contacts.extend(_parse_card(block, encodings, default_region))
+        except Exception:
+            continue
+    return contacts
+
+def _iter_batches(blocks: Iterator[bytes]) -> Iterator[List[bytes]]:
+    """Groups card blocks into lists of CARD_BATCH_SIZE."""
+    while True:
+        batch = list(itertools.islice(blocks, CARD_BATCH_SIZE))
+        if not batch:
+            return
+        yield batch
+
+def _drain(items: collections.deque) -> Iterator:
+    """Yields the items of a deque, removing each one as it is yielded."""
+    while items:
+        yield items.popleft()
+
+def _map_bounded(executor: Executor, fn: Callable, items: Iterable, max_pending: int) -> Iterator:
+    """
+    Like `executor.map`, but keeps at most `max_pending` tasks in flight so
+    the input is consumed as results are used, not read ahead in full.
+    """
+    pending = collections.deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+def _parse_batches(batches: Iterator[List[bytes]], parse_batch: Callable) -> Iterator[List[Tuple[str, str]]]:
+    """
+    Parses card batches, in parallel across CPU cores when the input is large
+    enough, yielding each batch's contacts in file order.
+    """
+    workers = os.cpu_count() or 1
+    min_batches = POOL_MIN_BATCHES_PER_WORKER * workers
+    head = collections.deque(itertools.islice(batches, min_batches) if workers > 1 else ())
+    # The look-ahead batches are popped as they are used, so they are freed
+    # instead of staying referenced for the whole conversion.
+    all_batches = itertools.chain(_drain(head), batches)
+    if len(head) < min_batches:
+        for batch in all_batches:
+            yield parse_batch(batch)
+        return
+
+    # "spawn" everywhere: forking a process that runs Tk and a worker
+    # thread is not safe.
+    executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
     try:
-        for card_text in vcf_content.split('BEGIN:VCARD'):
-            if 'END:VCARD' in card_text:
-                full_card = 'BEGIN:VCARD\n' + card_text
-                try:
-                    vcard = vobject.readOne(full_card)
-                    name = get_contact_name(vcard)
-                    normalized_numbers: Set[str] = set()
-                    if hasattr(vcard, 'tel_list'):
-                        for tel in vcard.tel_list:
-                            if tel.value and tel.value.strip():
-                                normalized = normalize_phone_number(tel.value, default_region)
-                                if normalized:
-                                    normalized_numbers.add(normalized)
-                    
-                    if not normalized_numbers:
-                        continue
-                        
-                    for number in sorted(list(normalized_numbers)):
-                        processed_contacts.append((name, number))
-                except Exception:
-                    continue
+        yield from _map_bounded(executor, parse_batch, all_batches, 2 * workers)
+    finally:
+        executor.shutdown(cancel_futures=True)
 
-    except Exception as e:
-        raise ValueError(f"Failed to parse VCF data. The file might be corrupted. Details: {e}")
+def iter_cards(file_path: str, default_region: str) -> Iterator[Tuple[str, str]]:
+    """
+    Lazily parses a VCF file and yields unique (name, phone_number) tuples in
+    file order. Only a bounded number of card batches is in memory at a time.
+    """
+    try:
+        f = open(file_path, 'rb')
+    except (IOError, FileNotFoundError) as e:
+        raise ValueError(f"Could not read the file from disk: {e}")
 
-    return processed_contacts
+    with f:
+        try:
+            buffer = f.read(READ_BUFFER_SIZE)
+            encodings = detect_encodings(buffer)
+            parse_batch = functools.partial(_parse_batch, encodings=encodings, default_region=default_region)
+            batches = _iter_batches(_iter_card_blocks(f, buffer))
+
+            # Merged exports (e.g. Google + iCloud) repeat whole contacts, so
+            # rows are deduplicated across the file, not only within a card.
+            seen: Set[Tuple[str, str]] = set()
+            for contacts in _parse_batches(batches, parse_batch):
+                for contact in contacts:
+                    if contact not in seen:
+                        seen.add(contact)
+                        yield contact
+        except Exception as e:
+            raise ValueError(f"Failed to parse VCF data. The file might be corrupted. Details: {e}")
 
-def create_excel_file(data: List[Tuple[str, str]], output_path: str):
-    """Creates an XLSX file from the processed contact data."""
-    workbook = openpyxl.Workbook()
-    sheet = workbook.active
-    assert sheet is not None
-    sheet.title = "Contacts"
+def create_excel_file(data: Iterable[Tuple[str, str]], output_path: str) -> int:
+    """
+    Creates an XLSX file from the processed contact data and returns the
+    number of contact rows written. Rows are streamed straight to disk
+    (write-only mode), so memory stays constant regardless of the row count.
+    """
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet("Contacts")
     sheet.sheet_view.rightToLeft = True
+    sheet.freeze_panes = 'A2'
 
     header = ["الاسم", "الرقم"]
-    sheet.append(header)
-    
+    data = iter(data)
+    head_rows = list(itertools.islice(data, WIDTH_SAMPLE_ROWS))
+
+    # Single pass over the held-back rows to size the columns.
+    max_name_len, max_num_len = len(header[0]), len(header[1])
+    for name, number in head_rows:
+        name_len = len(name)
+        if name_len > max_name_len:
+            max_name_len = name_len
+        num_len = len(number)
+        if num_len > max_num_len:
+            max_num_len = num_len
+    sheet.column_dimensions['A'].width = (max_name_len + 2) * 1.2
+    sheet.column_dimensions['B'].width = (max_num_len + 2) * 1.2
+
     header_font = OpenPyxlFont(bold=True)
-    for cell in sheet[1]:
+    header_cells = []
+    for title in header:
+        cell = WriteOnlyCell(sheet, value=title)
         cell.font = header_font
+        header_cells.append(cell)
+    sheet.append(header_cells)
     
-    sheet.freeze_panes = 'A2'
-    
-    for name, number in data:
-        sheet.append([name, number])
-        
-    for cell in sheet['B']:
-        cell.number_format = '@'
-
-    for column_cells in sheet.columns:
-        max_length = 0
-        column = get_column_letter(column_cells[0].column)
-        for cell in column_cells:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-        adjusted_width = (max_length + 2) * 1.2
-        sheet.column_dimensions[column].width = adjusted_width
+    row_count = 0
+    for name, number in itertools.chain(head_rows, data):
+        number_cell = WriteOnlyCell(sheet, value=number)
+        number_cell.number_format = '@'
+        sheet.append([name, number_cell])
+        row_count += 1
 
     workbook.save(output_path)
+    return row_count
 
 
 # --- Frontend Logic (GUI Application Class) ---
@@ -181,6 +404,7 @@ class VcfConverterApp:
         self.root.configure(bg="#1E1E1E")
 
         self.input_filepath = None
+        self.progress_queue = None
         
         # --- Modern Fonts ---
         self.font_main = font.Font(family="Segoe UI", size=12)
@@ -195,6 +419,19 @@ class VcfConverterApp:
         self.COLOR_SUCCESS = "#28a745"
         self.COLOR_ERROR = "#d9534f"
         
+        # --- Button Styles (hover/disabled states are handled by Tk itself) ---
+        # "clam" is used because native themes ignore custom background colors.
+        style = ttk.Style(root)
+        style.theme_use("clam")
+        style.configure("Dark.TButton", font=self.font_main, background=self.COLOR_ACCENT,
+                        foreground=self.COLOR_TEXT, borderwidth=0, relief="flat", padding=(10, 6))
+        style.map("Dark.TButton",
+                  background=[("disabled", "#3A3A3A"), ("active", "#005f9e")],
+                  foreground=[("disabled", "#a0a0a0"), ("active", "white")])
+        style.configure("Success.Dark.TButton", font=self.font_bold, background=self.COLOR_SUCCESS, padding=(10, 14))
+        style.map("Success.Dark.TButton",
+                  background=[("disabled", "#3A3A3A"), ("active", "#218838")])
+
         # --- Main container frame ---
         main_frame = tk.Frame(root, bg=self.COLOR_BG, padx=30, pady=30)
         main_frame.pack(fill="both", expand=True)
@@ -207,9 +444,8 @@ class VcfConverterApp:
         file_frame = tk.Frame(main_frame, bg=self.COLOR_FRAME, relief="solid", bd=1)
         file_frame.pack(fill="x", pady=20, ipady=10, ipadx=10)
 
-        self.select_btn = tk.Button(file_frame, text="📂  اختيار ملف VCF", command=self.select_file, 
-                                     font=self.font_main, bg=self.COLOR_ACCENT, fg=self.COLOR_TEXT, 
-                                     relief="flat", width=18, activebackground="#005f9e", activeforeground="white", cursor="hand2")
+        self.select_btn = ttk.Button(file_frame, text="📂  اختيار ملف VCF", command=self.select_file,
+                                     style="Dark.TButton", width=18, cursor="hand2")
         self.select_btn.pack(side="left", padx=(10, 10))
 
         self.file_label = tk.Label(file_frame, text="...لم يتم اختيار أي ملف", bg=self.COLOR_FRAME, 
@@ -217,10 +453,8 @@ class VcfConverterApp:
         self.file_label.pack(side="left", fill="x", expand=True)
         
         # --- Convert Button ---
-        self.convert_btn = tk.Button(main_frame, text="🚀  بدء التحويل", command=self.convert, 
-                                      font=self.font_bold, bg=self.COLOR_SUCCESS, fg=self.COLOR_TEXT, 
-                                      relief="flat", height=2, state="disabled",
-                                      activebackground="#218838", activeforeground="white", cursor="hand2")
+        self.convert_btn = ttk.Button(main_frame, text="🚀  بدء التحويل", command=self.convert,
+                                      style="Success.Dark.TButton", state="disabled", cursor="hand2")
         self.convert_btn.pack(fill="x", pady=(20, 10))
         
         # --- Status Bar ---
@@ -228,18 +462,6 @@ class VcfConverterApp:
                                       padx=10, font=self.font_status, bg="#252526", fg=self.COLOR_TEXT)
         self.status_label.pack(side="bottom", fill="x")
 
-        # --- Hover Effects ---
-        self.select_btn.bind("<Enter>", lambda e: self.select_btn.config(bg="#005f9e"))
-        self.select_btn.bind("<Leave>", lambda e: self.select_btn.config(bg=self.COLOR_ACCENT))
-        
-        def on_convert_enter(e):
-            if self.convert_btn['state'] == 'normal': self.convert_btn.config(bg="#218838")
-        def on_convert_leave(e):
-            if self.convert_btn['state'] == 'normal': self.convert_btn.config(bg=self.COLOR_SUCCESS)
-
-        self.convert_btn.bind("<Enter>", on_convert_enter)
-        self.convert_btn.bind("<Leave>", on_convert_leave)
-
     def select_file(self):
         filepath = filedialog.askopenfilename(
             title="اختر ملف vCard",
@@ -249,7 +471,7 @@ class VcfConverterApp:
             self.input_filepath = filepath
             filename = os.path.basename(filepath)
             self.file_label.config(text=filename, fg=self.COLOR_TEXT)
-            self.convert_btn.config(state="normal", bg=self.COLOR_SUCCESS)
+            self.convert_btn.config(state="normal")
             self.update_status(f"تم اختيار الملف: {filename}", "black")
 
     def convert(self):
@@ -257,39 +479,81 @@ class VcfConverterApp:
             messagebox.showerror("خطأ", "الرجاء اختيار ملف VCF أولاً.")
             return
 
-        default_region = "DZ"
-        
+        output_path = filedialog.asksaveasfilename(
+            title="حفظ ملف Excel باسم",
+            defaultextension=".xlsx",
+            filetypes=[("Excel Files", "*.xlsx")],
+            initialfile=f"{os.path.splitext(os.path.basename(self.input_filepath))[0]}.xlsx"
+        )
+
+        if not output_path:
+            self.update_status("تم إلغاء العملية.", "gray")
+            return
+
+        self.select_btn.config(state="disabled")
+        self.convert_btn.config(state="disabled")
         self.update_status("...جاري المعالجة، يرجى الانتظار", "blue")
-        self.root.update_idletasks()
 
-        try:
-            vcf_content = read_vcf_content(self.input_filepath)
-            contact_data = process_vcf_data(vcf_content, default_region)
+        # The conversion runs on a worker thread; Tk is only touched from the
+        # main thread, which drains the worker's messages via `root.after`.
+        self.progress_queue = queue.Queue()
+        threading.Thread(target=self._do_convert, args=(self.input_filepath, output_path), daemon=True).start()
+        self.root.after(QUEUE_POLL_MS, self._drain_queue)
 
-            if not contact_data:
-                self.update_status("لم يتم العثور على أي جهات اتصال تحتوي على أرقام هواتف.", "orange")
-                messagebox.showwarning("تنبيه", "لم يتم العثور على أي جهات اتصال تحتوي على أرقام هواتف في الملف المحدد.")
-                return
+    def _do_convert(self, input_path, output_path):
+        """Worker thread: converts the file and reports through `progress_queue`."""
+        default_region = "DZ"
 
-            output_path = filedialog.asksaveasfilename(
-                title="حفظ ملف Excel باسم",
-                defaultextension=".xlsx",
-                filetypes=[("Excel Files", "*.xlsx")],
-                initialfile=f"{os.path.splitext(os.path.basename(self.input_filepath))[0]}.xlsx"
-            )
+        try:
+            contacts = iter_cards(input_path, default_region)
+            first_contact = next(contacts, None)
 
-            if not output_path:
-                self.update_status("تم إلغاء العملية.", "gray")
+            if first_contact is None:
+                self.progress_queue.put(("empty",))
                 return
 
-            create_excel_file(contact_data, output_path)
-            
-            self.update_status(f"تم التحويل بنجاح! {len(contact_data)} رقم تم حفظه.", "green")
-            messagebox.showinfo("نجاح", f"تم حفظ الملف بنجاح في:\n{output_path}")
+            rows = self._report_progress(itertools.chain([first_contact], contacts))
+            row_count = create_excel_file(rows, output_path)
+            self.progress_queue.put(("done", row_count, output_path))
 
         except Exception as e:
-            self.update_status(f"خطأ: {e}", "red")
-            messagebox.showerror("حدث خطأ", str(e))
+            self.progress_queue.put(("error", e))
+
+    def _report_progress(self, contacts):
+        for count, contact in enumerate(contacts, 1):
+            if count % PROGRESS_INTERVAL == 0:
+                self.progress_queue.put(("progress", count))
+            yield contact
+
+    def _drain_queue(self):
+        """Main thread: applies the worker's messages to the UI until it finishes."""
+        try:
+            while True:
+                message = self.progress_queue.get_nowait()
+                kind = message[0]
+                if kind == "progress":
+                    self.update_status(f"...جاري المعالجة، تمت قراءة {message[1]} رقم", "blue")
+                    continue
+
+                self._finish_conversion()
+                if kind == "empty":
+                    self.update_status("لم يتم العثور على أي جهات اتصال تحتوي على أرقام هواتف.", "orange")
+                    messagebox.showwarning("تنبيه", "لم يتم العثور على أي جهات اتصال تحتوي على أرقام هواتف في الملف المحدد.")
+                elif kind == "done":
+                    _, row_count, output_path = message
+                    self.update_status(f"تم التحويل بنجاح! {row_count} رقم تم حفظه.", "green")
+                    messagebox.showinfo("نجاح", f"تم حفظ الملف بنجاح في:\n{output_path}")
+                elif kind == "error":
+                    self.update_status(f"خطأ: {message[1]}", "red")
+                    messagebox.showerror("حدث خطأ", str(message[1]))
+                return
+        except queue.Empty:
+            pass
+        self.root.after(QUEUE_POLL_MS, self._drain_queue)
+
+    def _finish_conversion(self):
+        self.select_btn.config(state="normal")
+        self.convert_btn.config(state="normal")
 
     def update_status(self, message, color_name):
         color_map = {
@@ -301,6 +565,7 @@ class VcfConverterApp:
 
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()
     root = tk.Tk()
     app = VcfConverterApp(root)
     root.mainloop()